@@ -63,13 +63,11 @@ async def set_collision_strategy(request: CollisionStrategyRequest):
 		return {'message': 'Modo encadenamiento activado'}
 
 	if request.type == 'linear':
-		service.resolver = LinearResolver()
-		service.mode = 'open'
+		service.set_resolver(LinearResolver())
 		return {'message': 'Colisión lineal activada'}
 
 	if request.type == 'quadratic':
-		service.resolver = QuadraticResolver()
-		service.mode = 'open'
+		service.set_resolver(QuadraticResolver())
 		return {'message': 'Colisión cuadrática activada'}
 
 	if request.type == 'double':
@@ -78,8 +76,7 @@ async def set_collision_strategy(request: CollisionStrategyRequest):
 
 		second_hash = build_hash_function(HashFunctionRequest(type=request.second_hash_type))
 
-		service.resolver = DoubleHashResolver(second_hash)
-		service.mode = 'open'
+		service.set_resolver(DoubleHashResolver(second_hash))
 		return {'message': 'Doble hashing activado'}
 
 	raise HTTPException(status_code=400, detail='Estrategia inválida')
@@ -103,10 +100,14 @@ async def get_state():
 	if service is None:
 		raise HTTPException(status_code=400, detail='Defina primero la función hash')
 
+	data = service.data
+	if service.mode == 'chaining':
+		data = [bucket or [] for bucket in data]
+
 	return {
 		'size': service.size,
 		'digits': service.digits,
-		'data': service.data,
+		'data': data,
 	}
 
 
@@ -26,6 +26,7 @@ along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from typing import List, Optional
 
 
@@ -106,39 +107,99 @@ class BaseSearchService(ABC):
 	def insert(self, value: str) -> int:
 		"""Insert a new key into the structure.
 
-		The key is placed in the first available position and the
-		structure is automatically sorted after insertion.
+		Occupied positions always form a sorted prefix, so the key is
+		placed at its ordered position found by binary search over that
+		prefix and the trailing empty positions shift by one. No full
+		re-sort is required.
 
 		Args:
 			value (str): The numeric key to insert.
 
 		Returns:
-			int: The 1-based position where the key was initially inserted.
+			int: The 1-based position where the key was inserted.
 
 		Raises:
 			ValueError: If the structure is not initialized, the key
 				is invalid, already exists, or there is no available space.
 
 		"""
-		self._validate_structure()
-		self._validate_value(value)
+		if not (self.initialized and len(value) == self.digits and value.isdigit()):
+			self._validate_structure()
+			self._validate_value(value)
+
+		data = self.data
+		try:
+			count = data.index(None)
+		except ValueError:
+			count = len(data)
 
-		if value in self.data:
+		index = bisect_left(data, value, 0, count)
+		if index < count and data[index] == value:
 			raise ValueError(f'La clave {value} ya existe en la estructura')
 
-		try:
-			index = self.data.index(None)
-		except ValueError as exc:
-			raise ValueError('No hay espacio disponible en la estructura') from exc
+		if count == len(data):
+			raise ValueError('No hay espacio disponible en la estructura')
 
-		self.data[index] = value
-		self.sort()
+		data.insert(index, value)
+		data.pop()
 
 		return index + 1
 
+	def insert_many(self, values: List[str]) -> List[int]:
+		"""Insert several keys into the structure.
+
+		The whole batch is validated before any key is inserted. Keys
+		are then inserted one at a time and their positions are looked
+		up once the batch is complete, since later inserts can shift
+		keys placed earlier. Subclasses can override this method to
+		load the whole batch at once, or `_position_of` when `search`
+		does not report plain positions.
+
+		Args:
+			values (List[str]): The numeric keys to insert.
+
+		Returns:
+			List[int]: The final 1-based position of each key, in the
+				same order as `values`.
+
+		Raises:
+			ValueError: If the structure is not initialized, or a key is
+				invalid, repeated or already stored. Nothing is inserted
+				in that case. If the structure runs out of space midway,
+				the keys before the failing one remain inserted.
+
+		"""
+		self._validate_structure()
+		seen = set()
+		for value in values:
+			self._validate_value(value)
+			if value in seen or self.search(value):
+				raise ValueError(f'La clave {value} ya existe en la estructura')
+			seen.add(value)
+
+		for value in values:
+			self.insert(value)
+		return [self._position_of(value) for value in values]
+
+	def _position_of(self, value: str) -> int:
+		"""Return the current 1-based position of a stored key.
+
+		Args:
+			value (str): A key known to be stored.
+
+		Returns:
+			int: The first position reported by `search`.
+
+		"""
+		return self.search(value)[0]
+
 	def delete(self, value: str) -> List[int]:
 		"""Delete all occurrences of a key from the structure.
 
+		Matching entries are removed from the ordered prefix and the
+		same number of empty positions is appended at the end, which
+		keeps the structure sorted without a full re-sort.
+
 		Args:
 			value (str): The numeric key to delete.
 
@@ -158,10 +219,10 @@ class BaseSearchService(ABC):
 		if not positions:
 			return []
 
-		for pos in positions:
-			self.data[pos - 1] = None
+		for pos in reversed(positions):
+			del self.data[pos - 1]
+		self.data.extend([None] * len(positions))
 
-		self.sort()
 		return positions
 
 	def sort(self) -> None:
@@ -176,7 +237,10 @@ class BaseSearchService(ABC):
 		"""
 		self._validate_structure()
 
-		self.data = sorted(v for v in self.data if v is not None) + [None] * self.data.count(None)
+		values = [v for v in self.data if v is not None]
+		values.sort()
+		values.extend([None] * (len(self.data) - len(values)))
+		self.data = values
 
 	def reset(self) -> None:
 		"""Reset the structure to its initial unconfigured state.
@@ -51,10 +51,7 @@ class BinarySearchService(BaseSearchService):
 				the key format is invalid, or the key is not found.
 
 		"""
-		if not self.initialized:
-			return []
-
-		if len(value) != self.digits or not value.isdigit():
+		if not (self.initialized and len(value) == self.digits and value.isdigit()):
 			return []
 
 		valid_data = [v for v in self.data if v is not None]
@@ -157,6 +157,21 @@ class BaseExternalSearch(BaseSearchService):
 		self.sort()
 		return global_pos
 
+	def _position_of(self, value: str) -> int:
+		"""
+		Return the current global position of a stored key.
+
+		Args:
+			value (str):
+				A key known to be stored.
+
+		Returns:
+			int:
+				1-based global position reported by `search`.
+
+		"""
+		return self.search(value)[0]['global_position']
+
 	def delete(self, value: str) -> List[int]:
 		"""
 		Remove all occurrences of a key from the structure.
@@ -228,6 +228,21 @@ class DynamicHashExternalSearch(BaseSearchService):
 			overflow_before = sum(len(self.overflow[i]) for i in range(bucket_idx))
 			return total_principal + overflow_before + overflow_idx + 1
 
+	def _position_of(self, value: str) -> int:
+		"""
+		Return the current global position of a stored key.
+
+		Args:
+			value (str):
+				A key known to be stored.
+
+		Returns:
+			int:
+				1-based global position reported by `search`.
+
+		"""
+		return self.search(value)[0]['global_position']
+
 	def search(self, value: str) -> List[Dict[str, int]]:
 		"""Search for a key in the structure.
 
@@ -45,7 +45,7 @@ from typing import Dict, List, Optional, Tuple
 from app.services.search.external.base_external import BaseExternalSearch
 from app.services.search.hash.abstract_hash import HashMixin
 from app.services.search.hash.collision_simple import CollisionResolver
-from app.services.search.hash.hash_function import HashFunction
+from app.services.search.hash.hash_function import HashFunction, index_digits
 
 
 class HashExternalSearch(BaseExternalSearch):
@@ -395,7 +395,7 @@ class BaseConversionHash(HashFunction):
 			digit = int(ch)
 			num = num * self.base + digit
 
-		d = len(str(size - 1))
+		d = index_digits(size)
 
 		s = str(num)
 		if len(s) <= d:
@@ -47,8 +47,8 @@ class HashMixin:
 	"""Provide shared hashing behavior for hash-based structures.
 
 	This mixin encapsulates common operations required by hash tables,
-	such as computing normalized hash values and determining the next
-	probing position when collisions occur.
+	such as computing normalized hash values and exposing the probe
+	sequence used when collisions occur.
 
 	It supports two main modes of operation:
 
@@ -72,16 +72,20 @@ class HashMixin:
 			Strategy used to compute the next probe location when
 			collisions occur.
 
+		_hash (Callable[[str, int, int], int]):
+			Bound ``hash`` method of the hash function, cached so
+			hot loops skip the attribute lookup on every call.
+
+		_probe_sequence (Optional[Callable[[str, int, int, int], Iterator[int]]]):
+			Bound ``probe_sequence`` method of the resolver, or None
+			when no resolver is configured.
+
 		mode (str):
 			Operating mode of the hash structure. Possible values:
 
 				- "none": no collision handling
 				- "open": open addressing with probing
 
-		_DELETED (object):
-			Sentinel marker used to represent deleted entries in
-			open addressing tables.
-
 	"""
 
 	def __init__(self, hash_func: HashFunction, resolver: Optional[CollisionResolver] = None):
@@ -98,9 +102,24 @@ class HashMixin:
 
 		"""
 		self.hash_func = hash_func
+		self._hash = hash_func.hash
+		self.set_resolver(resolver)
+
+	def set_resolver(self, resolver: Optional[CollisionResolver]) -> None:
+		"""Configure the collision resolution strategy.
+
+		Switch to open addressing when a resolver is given, or back
+		to "none" mode when it is None, and refresh the cached
+		``_probe_sequence`` used by the probing loops.
+
+		Args:
+			resolver (Optional[CollisionResolver]):
+				Strategy used to compute probe positions.
+
+		"""
 		self.resolver = resolver
 		self.mode = 'open' if resolver is not None else 'none'
-		self._DELETED = object()
+		self._probe_sequence = resolver.probe_sequence if resolver is not None else None
 
 	def _compute_raw_hash(self, value: str, digits: int, size: int) -> int:
 		"""Compute a normalized hash value within table bounds.
@@ -124,40 +143,4 @@ class HashMixin:
 				Normalized hash index in the range ``[0, size - 1]``.
 
 		"""
-		raw = self.hash_func.hash(value, digits, size)
-		return raw % size
-
-	def _probe(self, value: str, start_index: int, attempt: int, size: int, digits: int) -> int:
-		"""Compute the next probing position for open addressing.
-
-		If a collision resolver is configured, the next index is
-		calculated using the resolver's probing strategy
-		(e.g., linear probing, quadratic probing, or double hashing).
-
-		If no resolver is defined, the original hash position is
-		returned unchanged.
-
-		Args:
-		    value (str):
-		        Key being inserted or searched.
-
-		    start_index (int):
-		        Initial hash position.
-
-		    attempt (int):
-		        Current probing attempt number.
-
-		    size (int):
-		        Size of the hash table.
-
-		    digits (int):
-		        Number of digits used by the hash function.
-
-		Returns:
-		    int:
-		        Next index to probe in the table.
-
-		"""
-		if self.mode == 'open' and self.resolver:
-			return self.resolver.get_next(value, start_index, attempt, size, digits)
-		return start_index
+		return self._hash(value, digits, size) % size
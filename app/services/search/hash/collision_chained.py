@@ -33,7 +33,7 @@ class ChainedHashTable(BaseSearchService):
 
 	Store elements in buckets represented as dynamic Python lists.
 	Each index in the main table contains a list of keys that share
-	the same hash index.
+	the same hash index, or None until the first key is inserted there.
 	"""
 
 	def __init__(self, hash_func: HashFunction):
@@ -45,10 +45,12 @@ class ChainedHashTable(BaseSearchService):
 		"""
 		super().__init__()
 		self.hash_func = hash_func
-		self.data: List[List[str]] = []
+		self.data: List[Optional[List[str]]] = []
 
 	def create(self, size: int, digits: int) -> None:
-		"""Initialize table with empty chaining buckets.
+		"""Initialize table with unallocated chaining buckets.
+
+		Buckets are created on the first insertion into each index.
 
 		Args:
 		    size (int): Number of buckets in the table.
@@ -56,7 +58,6 @@ class ChainedHashTable(BaseSearchService):
 
 		"""
 		super().create(size, digits)
-		self.data = [[] for _ in range(size)]
 
 	def insert(self, value: str) -> int:
 		"""Insert key into corresponding chaining bucket.
@@ -78,6 +79,10 @@ class ChainedHashTable(BaseSearchService):
 		index = raw % self.size
 		bucket = self.data[index]
 
+		if bucket is None:
+			self.data[index] = [value]
+			return index + 1
+
 		if value in bucket:
 			raise ValueError(f'La clave {value} ya existe')
 
@@ -98,8 +103,9 @@ class ChainedHashTable(BaseSearchService):
 
 		raw = self.hash_func.hash(value, self.digits, self.size)
 		index = raw % self.size
+		bucket = self.data[index]
 
-		if value in self.data[index]:
+		if bucket is not None and value in bucket:
 			return [index + 1]
 
 		return []
@@ -120,7 +126,7 @@ class ChainedHashTable(BaseSearchService):
 		index = raw % self.size
 		bucket = self.data[index]
 
-		if value in bucket:
+		if bucket is not None and value in bucket:
 			bucket.remove(value)
 			return [index + 1]
 
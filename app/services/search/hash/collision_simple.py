@@ -22,6 +22,8 @@ along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
 from abc import ABC, abstractmethod
+from itertools import chain
+from typing import Iterator
 
 from app.services.search.hash.hash_function import HashFunction
 
@@ -53,6 +55,26 @@ class CollisionResolver(ABC):
 		"""
 		pass
 
+	def probe_sequence(self, key: str, initial: int, size: int, digits: int) -> Iterator[int]:
+		"""Yield the indices to probe for a key, one per attempt.
+
+		Each index is derived from the previous attempts, so the whole
+		sequence costs one step per probe. Subclasses may override this
+		method when the next index can be computed incrementally.
+
+		Args:
+		    key (str): Numeric string key being inserted or searched.
+		    initial (int): Initial index produced by primary hash.
+		    size (int): Size of the hash table.
+		    digits (int): Required number of digits for the key.
+
+		Yields:
+		    int: Next index to probe (0-based), at most ``size`` times.
+
+		"""
+		for attempt in range(size):
+			yield self.get_next(key, initial, attempt, size, digits)
+
 
 class LinearResolver(CollisionResolver):
 	"""Resolve collisions using linear probing."""
@@ -80,6 +102,10 @@ class LinearResolver(CollisionResolver):
 		"""
 		return (initial + attempt) % size
 
+	def probe_sequence(self, key: str, initial: int, size: int, digits: int) -> Iterator[int]:
+		"""Yield consecutive indices starting at ``initial`` and wrapping around."""
+		return chain(range(initial, size), range(initial))
+
 
 class QuadraticResolver(CollisionResolver):
 	"""Resolve collisions using quadratic probing."""
@@ -107,6 +133,10 @@ class QuadraticResolver(CollisionResolver):
 		"""
 		return (initial + attempt * attempt) % size
 
+	def probe_sequence(self, key: str, initial: int, size: int, digits: int) -> Iterator[int]:
+		"""Yield ``(initial + attempt^2) % size`` for every attempt."""
+		return ((initial + attempt * attempt) % size for attempt in range(size))
+
 
 class DoubleHashResolver(CollisionResolver):
 	"""Resolve collisions using double hashing strategy."""
@@ -158,3 +188,20 @@ class DoubleHashResolver(CollisionResolver):
 			current_1based = (raw % size) + 1
 
 		return current_1based - 1
+
+	def probe_sequence(self, key: str, initial: int, size: int, digits: int) -> Iterator[int]:
+		"""Yield the double hashing sequence, hashing once per attempt.
+
+		``get_next`` replays the whole chain of secondary hashes for
+		every attempt; here each index is derived from the previous
+		one, so a scan of ``n`` probes costs ``n`` hashes instead of
+		``n * (n - 1) / 2``.
+		"""
+		yield initial
+
+		second_hash = self.second_hash.hash
+		current_1based = initial + 1
+		for _ in range(1, size):
+			raw = second_hash(str(current_1based + 1), digits, size)
+			current_1based = (raw % size) + 1
+			yield current_1based - 1
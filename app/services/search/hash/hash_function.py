@@ -22,10 +22,30 @@ You should have received a copy of the GNU General Public License
 along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import math
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List
 
 
+@lru_cache(maxsize=None)
+def index_digits(size: int) -> int:
+	"""Return the number of digits needed to write the largest index.
+
+	The table size is fixed once a structure is created, so the
+	result is cached per size instead of being rebuilt with
+	``str`` on every hash.
+
+	Args:
+	    size (int): Size of the hash table.
+
+	Returns:
+	    int: Number of decimal digits of ``size - 1``.
+
+	"""
+	return len(str(size - 1))
+
+
 class HashFunction(ABC):
 	"""Define interface for hash function strategies."""
 
@@ -85,7 +105,7 @@ class SquareHash(HashFunction):
 		    int: Extracted middle portion of the squared key.
 
 		"""
-		d = len(str(size - 1))
+		d = index_digits(size)
 		num = int(key)
 		square = num * num
 		s = str(square)
@@ -162,7 +182,7 @@ class FoldingHash(HashFunction):
 		    int: Folded hash value.
 
 		"""
-		d = len(str(size - 1))
+		d = index_digits(size)
 		groups = []
 
 		for i in range(0, len(key), self.group_size):
@@ -171,9 +191,7 @@ class FoldingHash(HashFunction):
 		if self.operation == 'sum':
 			total = sum(groups)
 		else:
-			total = 1
-			for g in groups:
-				total *= g
+			total = math.prod(groups)
 
 		s = str(total)
 
@@ -15,7 +15,8 @@ modes depending on the configuration:
 
     - chaining:
         Separate chaining is used. Each position in the table stores a
-        list (bucket) containing all keys that hash to that index.
+        list (bucket) containing all keys that hash to that index. The
+        bucket is allocated on the first insertion into that position.
 
 Author: Juan Esteban Bedoya <jebedoyal@udistrital.edu.co>
 
@@ -42,6 +43,10 @@ from app.services.search.hash.abstract_hash import HashMixin
 from app.services.search.hash.collision_simple import CollisionResolver
 from app.services.search.hash.hash_function import HashFunction
 
+_EMPTY = 0
+_OCCUPIED = 1
+_DELETED = 2
+
 
 class CollisionWithoutStrategyError(Exception):
 	"""Exception raised when a collision occurs without a strategy.
@@ -73,11 +78,14 @@ class HashTable(BaseSearchService, HashMixin):
 
 	    - **chaining**
 	        Separate chaining, where each table position stores a list
-	        of keys that share the same hash index.
+	        of keys that share the same hash index, or None until the
+	        first key lands there.
 
 	The table stores keys as strings and returns positions using
 	1-based indexing to match the interface expected by the rest of
-	the system.
+	the system. Outside chaining mode, the state of every slot
+	(empty, occupied or deleted) is tracked in a parallel byte array
+	so probing loops only inspect one byte per slot.
 
 	Inheritance:
 	    BaseSearchService:
@@ -101,13 +109,14 @@ class HashTable(BaseSearchService, HashMixin):
 		"""
 		BaseSearchService.__init__(self)
 		HashMixin.__init__(self, hash_func, resolver)
+		self._state = bytearray()
 
 	def create(self, size: int, digits: int) -> None:
 		"""Initialize the hash table structure.
 
 		This method allocates the internal storage and prepares the
-		table for operations. The internal representation depends on
-		the collision handling mode.
+		table for operations. Every slot starts as None; in chaining
+		mode buckets are created lazily by insertion.
 
 		Args:
 		    size (int):
@@ -118,44 +127,67 @@ class HashTable(BaseSearchService, HashMixin):
 
 		"""
 		super().create(size, digits)
-
-		if self.mode == 'chaining':
-			self.data = [[] for _ in range(size)]
-		else:
-			self.data = [None] * size
+		self._state = bytearray(size)
 
 	def set_chaining(self) -> None:
 		"""Convert the table to separate chaining mode.
 
 		All existing keys are rehashed into a new structure where
-		each table index contains a list (bucket). Any previous
+		each occupied table index contains a list (bucket). Any previous
 		probing or open addressing configuration is removed.
 		"""
 		if self.mode == 'chaining':
 			return
 
-		keys = []
-		if self.mode == 'open':
-			for item in self.data:
-				if item is not None and item is not self._DELETED:
-					keys.append(item)
-		else:
-			for item in self.data:
-				if item is not None:
-					keys.append(item)
-
-		self.data = [[] for _ in range(self.size)]
+		keys = [item for item in self.data if item is not None]
+
+		self.data = [None] * self.size
+		self.set_resolver(None)
 		self.mode = 'chaining'
-		self.resolver = None
+		self._bind_mode()
 
+		# Fill the buckets directly: open addressing can leave a key stored
+		# twice, and the conversion must not fail halfway through.
+		data = self.data
 		for key in keys:
 			index = self._compute_raw_hash(key, self.digits, self.size)
-			self.data[index].append(key)
+			bucket = data[index]
+			if bucket is None:
+				data[index] = [key]
+			else:
+				bucket.append(key)
+
+	def set_resolver(self, resolver: Optional[CollisionResolver]) -> None:
+		"""Configure the collision resolution strategy.
+
+		Extend the mixin behavior by rebinding the operation handlers
+		to the ones specialized for the resulting mode.
+
+		Args:
+		    resolver (Optional[CollisionResolver]):
+		        Strategy used to compute probe positions.
+
+		"""
+		HashMixin.set_resolver(self, resolver)
+		self._bind_mode()
+
+	def _bind_mode(self) -> None:
+		"""Bind the insert, search and delete handlers for the current mode.
+
+		Each mode has its own handler set, so the public operations do
+		not need to branch on ``self.mode`` on every call. This method
+		must be called whenever the mode changes.
+		"""
+		self._insert_at = getattr(self, f'_insert_{self.mode}')
+		self._search_at = getattr(self, f'_search_{self.mode}')
+		self._delete_at = getattr(self, f'_delete_{self.mode}')
 
 	def insert(self, value: str) -> int:
 		"""Insert a key into the hash table.
 
-		The insertion process depends on the collision handling mode:
+		Structure and key checks are folded into a single condition;
+		the validators only run to raise the matching error. The
+		insertion process then depends on the collision handling mode:
 
 		    - chaining:
 		        The key is appended to the bucket at the computed index.
@@ -182,39 +214,13 @@ class HashTable(BaseSearchService, HashMixin):
 		        If a collision occurs while operating in "none" mode.
 
 		"""
-		self._validate_structure()
-		self._validate_value(value)
+		digits = self.digits
+		if not (self.initialized and len(value) == digits and value.isdigit()):
+			self._validate_structure()
+			self._validate_value(value)
 
-		index = self._compute_raw_hash(value, self.digits, self.size)
-
-		if self.mode == 'chaining':
-			bucket = self.data[index]
-			if value in bucket:
-				raise ValueError(f'La clave {value} ya existe')
-			bucket.append(value)
-			return index + 1
-
-		elif self.mode == 'open':
-			for attempt in range(self.size):
-				probe = self._probe(value, index, attempt, self.size, self.digits)
-				if self.data[probe] is None or self.data[probe] is self._DELETED:
-					self.data[probe] = value
-					return probe + 1
-				if self.data[probe] == value:
-					raise ValueError(f'La clave {value} ya existe')
-			raise ValueError('No hay espacio disponible para insertar la clave')
-
-		else:  # modo 'none'
-			if self.data[index] is not None:
-				if self.data[index] == value:
-					raise ValueError(f'La clave {value} ya existe')
-
-				raise CollisionWithoutStrategyError(
-					f'Colisión en la dirección {index + 1} para la clave {value}. '
-					'Define una solución de colisión.'
-				)
-			self.data[index] = value
-			return index + 1
+		size = self.size
+		return self._insert_at(value, self._hash(value, digits, size) % size)
 
 	def search(self, value: str) -> List[int]:
 		"""Search for a key in the hash table.
@@ -229,28 +235,11 @@ class HashTable(BaseSearchService, HashMixin):
 		        The list is empty if the key does not exist.
 
 		"""
-		self._validate_structure()
-		index = self._compute_raw_hash(value, self.digits, self.size)
+		if not self.initialized:
+			self._validate_structure()
 
-		if self.mode == 'chaining':
-			if value in self.data[index]:
-				return [index + 1]
-			return []
-
-		elif self.mode == 'open':
-			positions = []
-			for attempt in range(self.size):
-				probe = self._probe(value, index, attempt, self.size, self.digits)
-				if self.data[probe] is None:
-					break
-				if self.data[probe] == value:
-					positions.append(probe + 1)
-			return positions
-
-		else:
-			if self.data[index] == value:
-				return [index + 1]
-			return []
+		size = self.size
+		return self._search_at(value, self._hash(value, self.digits, size) % size)
 
 	def delete(self, value: str) -> List[int]:
 		"""Remove a key from the hash table.
@@ -265,32 +254,104 @@ class HashTable(BaseSearchService, HashMixin):
 		        The list is empty if the key was not found.
 
 		"""
-		self._validate_structure()
-		index = self._compute_raw_hash(value, self.digits, self.size)
+		if not self.initialized:
+			self._validate_structure()
 
-		if self.mode == 'chaining':
-			bucket = self.data[index]
-			if value in bucket:
-				bucket.remove(value)
-				return [index + 1]
-			return []
-
-		elif self.mode == 'open':
-			positions = []
-			for attempt in range(self.size):
-				probe = self._probe(value, index, attempt, self.size, self.digits)
-				if self.data[probe] is None:
-					break
-				if self.data[probe] == value:
-					self.data[probe] = self._DELETED
-					positions.append(probe + 1)
-			return positions
-
-		else:
+		size = self.size
+		return self._delete_at(value, self._hash(value, self.digits, size) % size)
+
+	def _insert_chaining(self, value: str, index: int) -> int:
+		"""Append a key to the bucket at ``index``, creating it if needed."""
+		bucket = self.data[index]
+		if bucket is None:
+			self.data[index] = [value]
+			return index + 1
+		if value in bucket:
+			raise ValueError(f'La clave {value} ya existe')
+		bucket.append(value)
+		return index + 1
+
+	def _insert_open(self, value: str, index: int) -> int:
+		"""Store a key in the first free slot of its probe sequence."""
+		data = self.data
+		state = self._state
+		for probe in self._probe_sequence(value, index, self.size, self.digits):
+			if state[probe] != _OCCUPIED:
+				data[probe] = value
+				state[probe] = _OCCUPIED
+				return probe + 1
+			if data[probe] == value:
+				raise ValueError(f'La clave {value} ya existe')
+		raise ValueError('No hay espacio disponible para insertar la clave')
+
+	def _insert_none(self, value: str, index: int) -> int:
+		"""Store a key at ``index`` or fail if the slot is taken."""
+		if self.data[index] is not None:
 			if self.data[index] == value:
-				self.data[index] = None
-				return [index + 1]
-			return []
+				raise ValueError(f'La clave {value} ya existe')
+
+			raise CollisionWithoutStrategyError(
+				f'Colisión en la dirección {index + 1} para la clave {value}. '
+				'Define una solución de colisión.'
+			)
+		self.data[index] = value
+		self._state[index] = _OCCUPIED
+		return index + 1
+
+	def _search_chaining(self, value: str, index: int) -> List[int]:
+		"""Look for a key inside the bucket at ``index``."""
+		bucket = self.data[index]
+		if bucket is not None and value in bucket:
+			return [index + 1]
+		return []
+
+	def _search_open(self, value: str, index: int) -> List[int]:
+		"""Follow the probe sequence until an empty slot is reached."""
+		positions = []
+		data = self.data
+		state = self._state
+		for probe in self._probe_sequence(value, index, self.size, self.digits):
+			if state[probe] == _EMPTY:
+				break
+			if data[probe] == value:
+				positions.append(probe + 1)
+		return positions
+
+	def _search_none(self, value: str, index: int) -> List[int]:
+		"""Compare the key stored at ``index``."""
+		if self.data[index] == value:
+			return [index + 1]
+		return []
+
+	def _delete_chaining(self, value: str, index: int) -> List[int]:
+		"""Remove a key from the bucket at ``index``."""
+		bucket = self.data[index]
+		if bucket is not None and value in bucket:
+			bucket.remove(value)
+			return [index + 1]
+		return []
+
+	def _delete_open(self, value: str, index: int) -> List[int]:
+		"""Mark every matching slot of the probe sequence as deleted."""
+		positions = []
+		data = self.data
+		state = self._state
+		for probe in self._probe_sequence(value, index, self.size, self.digits):
+			if state[probe] == _EMPTY:
+				break
+			if data[probe] == value:
+				data[probe] = None
+				state[probe] = _DELETED
+				positions.append(probe + 1)
+		return positions
+
+	def _delete_none(self, value: str, index: int) -> List[int]:
+		"""Clear the slot at ``index`` if it holds the key."""
+		if self.data[index] == value:
+			self.data[index] = None
+			self._state[index] = _EMPTY
+			return [index + 1]
+		return []
 
 	def sort(self) -> None:
 		"""Disable sorting for hash tables.
@@ -32,8 +32,52 @@ class LinearSearchService(BaseSearchService):
 
 	Perform sequential traversal over the internal data managed by
 	the base service and collect all positions where the key matches.
+	The traversal itself runs inside ``list.index``, so each scanned
+	slot costs a C-level comparison instead of a Python iteration.
 	"""
 
+	def insert_many(self, values: List[str]) -> List[int]:
+		"""Insert several keys with a single sort.
+
+		Validate the whole batch before touching the structure, then
+		merge it with the stored keys and sort once, instead of placing
+		each key individually.
+
+		Args:
+		    values (List[str]): Numeric keys to insert.
+
+		Returns:
+		    List[int]: Final 1-based position of each key, in the same
+		        order as `values`.
+
+		Raises:
+		    ValueError: If the structure is not initialized, a key is
+		        invalid or repeated, or the batch does not fit. In that
+		        case no key is inserted.
+
+		"""
+		self._validate_structure()
+		for value in values:
+			self._validate_value(value)
+
+		keys = [v for v in self.data if v is not None]
+		present = set(keys)
+		for value in values:
+			if value in present:
+				raise ValueError(f'La clave {value} ya existe en la estructura')
+			present.add(value)
+
+		if len(keys) + len(values) > len(self.data):
+			raise ValueError('No hay espacio disponible en la estructura')
+
+		keys.extend(values)
+		keys.sort()
+		positions = {key: i + 1 for i, key in enumerate(keys)}
+		keys.extend([None] * (len(self.data) - len(keys)))
+		self.data = keys
+
+		return [positions[value] for value in values]
+
 	def search(self, value: str) -> List[int]:
 		"""Search for a key using the linear search algorithm.
 
@@ -49,10 +93,15 @@ class LinearSearchService(BaseSearchService):
 		        the key format is invalid, or the key is not found.
 
 		"""
-		if not self.initialized:
-			return []
-
-		if len(value) != self.digits or not value.isdigit():
+		if not (self.initialized and len(value) == self.digits and value.isdigit()):
 			return []
 
-		return [i + 1 for i, v in enumerate(self.data) if str(v).zfill(self.digits) == value]
+		data = self.data
+		positions = []
+		try:
+			i = data.index(value)
+			while True:
+				positions.append(i + 1)
+				i = data.index(value, i + 1)
+		except ValueError:
+			return positions
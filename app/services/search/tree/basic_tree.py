@@ -23,23 +23,68 @@ You should have received a copy of the GNU General Public License
 along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
+import heapq
+import logging
 from abc import abstractmethod
-from typing import List, Optional
-
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.services.search.base_search import BaseSearchService
 
+logger = logging.getLogger(__name__)
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+@lru_cache(maxsize=256)
+def _encode_letter(encoding: str, digits: int, letter: str) -> str:
+	"""
+	Convert a letter to its zero-padded binary representation.
+
+	Results are memoized per (encoding, digits, letter), since the
+	set of possible inputs is small and closed.
+
+	Raises:
+		ValueError: If encoding type is unsupported.
+
+	"""
+	if encoding == 'ABC':
+		pos = ALPHABET.index(letter) + 1
+		return format(pos, 'b').zfill(digits)
+	elif encoding == 'ASCII':
+		codigo = ord(letter)
+		return format(codigo, 'b').zfill(digits)
+	else:
+		raise ValueError(f'Codificación desconocida: {encoding}')
+
+
+@lru_cache(maxsize=256)
+def _decode_binary(encoding: str, binary: str) -> str:
+	"""
+	Convert a binary string back to its letter representation.
+
+	Raises:
+		ValueError: If encoding type is unsupported.
+
+	"""
+	if encoding == 'ABC':
+		return ALPHABET[int(binary, 2) - 1]
+	elif encoding == 'ASCII':
+		return chr(int(binary, 2))
+	else:
+		raise ValueError(f'Codificación desconocida: {encoding}')
+
 
 class DigitalNode:
 	"""
 	Represent a binary node for digital tree structures.
 
-	Store letter metadata, binary representation, and child references.
+	Store letter metadata, the binary representation as an integer key,
+	and child references.
 	"""
 
+	__slots__ = ('letter', 'key', 'index', 'left', 'right')
+
 	def __init__(
 		self,
 		letter: Optional[str] = None,
@@ -51,12 +96,12 @@ class DigitalNode:
 
 		Args:
 			letter: Store the associated letter.
-			binary: Store the binary representation of the letter.
+			binary: Binary representation of the letter, stored as an integer key.
 			index: Store the position in the underlying data array.
 
 		"""
 		self.letter = letter
-		self.binary = binary
+		self.key = int(binary, 2) if binary else None
 		self.index = index
 		self.left: Optional[DigitalNode] = None
 		self.right: Optional[DigitalNode] = None
@@ -66,9 +111,12 @@ class SimpleNode:
 	"""
 	Represent a binary node for simple tree structures.
 
-	Store letter metadata, binary representation, and left/right children.
+	Store letter metadata, the binary representation as an integer key,
+	and left/right children.
 	"""
 
+	__slots__ = ('letter', 'key', 'index', 'left', 'right')
+
 	def __init__(
 		self,
 		letter: Optional[str] = None,
@@ -80,12 +128,12 @@ class SimpleNode:
 
 		Args:
 			letter: Store the associated letter.
-			binary: Store the binary representation of the letter.
+			binary: Binary representation of the letter, stored as an integer key.
 			index: Store the position in the underlying data array.
 
 		"""
 		self.letter = letter
-		self.binary = binary
+		self.key = int(binary, 2) if binary else None
 		self.index = index
 		self.left: Optional[SimpleNode] = None
 		self.right: Optional[SimpleNode] = None
@@ -101,10 +149,12 @@ class MultiNode:
 		"""
     Represent a multi-way node for m-ary tree structures.
 
-    Maintain a fixed number of children determined by 2^m.
+    Maintain up to 2^m children, stored sparsely by child index.
     """
 	)
 
+	__slots__ = ('m', 'letter', 'key', 'index', 'children')
+
 	def __init__(
 		self,
 		m: int,
@@ -115,18 +165,21 @@ class MultiNode:
 		"""
 		Initialize an m-ary tree node.
 
+		Children are allocated lazily, so an empty slot is simply
+		absent from the mapping.
+
 		Args:
 		    m: Define branching factor exponent (number of children = 2^m).
 		    letter: Store the associated letter.
-		    binary: Store the binary representation of the letter.
+		    binary: Binary representation of the letter, stored as an integer key.
 		    index: Store the position in the underlying data array.
 
 		"""
 		self.m = m
 		self.letter = letter
-		self.binary = binary
+		self.key = int(binary, 2) if binary else None
 		self.index = index
-		self.children: List[Optional[MultiNode]] = [None] * (2**m)
+		self.children: Dict[int, MultiNode] = {}
 
 
 class BaseTree(BaseSearchService):
@@ -152,6 +205,10 @@ class BaseTree(BaseSearchService):
 		self.encoding = encoding.upper()
 		self.root = None
 		self._node_positions = {}
+		self._letter_to_bin: Dict[str, str] = {}
+		self._bin_to_letter: Dict[str, str] = {}
+		self._free: List[int] = []
+		self._present: Set[str] = set()
 
 	def create(self, size: int = None, digits: int = None) -> None:
 		"""
@@ -169,11 +226,29 @@ class BaseTree(BaseSearchService):
 				digits = 8
 		super().create(size, digits)
 		self.root = None
+		self._free = list(range(self.size))
+		self._present = set()
+		self._build_tables()
+
+	def _build_tables(self) -> None:
+		"""
+		Precompute the letter/binary lookup tables for the current digits.
+
+		Leave both tables empty for unsupported encodings so the error
+		is still raised by the conversion itself.
+		"""
+		if self.encoding not in ('ABC', 'ASCII'):
+			self._letter_to_bin = {}
+			self._bin_to_letter = {}
+			return
+		self._letter_to_bin = {
+			letter: _encode_letter(self.encoding, self.digits, letter) for letter in ALPHABET
+		}
+		self._bin_to_letter = {binary: letter for letter, binary in self._letter_to_bin.items()}
 
 	def _normalize_letter(self, letter: str) -> str:
 		letter = letter.upper()
-		alfabeto = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-		if letter not in alfabeto:
+		if letter not in ALPHABET:
 			raise ValueError(f"Letra '{letter}' no válida. Use solo letras del alfabeto americano.")
 		return letter
 
@@ -181,74 +256,173 @@ class BaseTree(BaseSearchService):
 		"""
 		Convert a letter to its binary representation.
 
-		Apply the configured encoding strategy.
+		Read the table precomputed in `create()` and fall back to the
+		configured encoding strategy for inputs outside of it.
 
 		Raises:
 			ValueError: If encoding type is unsupported.
 
 		"""
-		if self.encoding == 'ABC':
-			alfabeto = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-			pos = alfabeto.index(letter) + 1
-			return format(pos, 'b').zfill(self.digits)
-		elif self.encoding == 'ASCII':
-			codigo = ord(letter)
-			return format(codigo, 'b').zfill(self.digits)
-		else:
-			raise ValueError(f'Codificación desconocida: {self.encoding}')
+		binary = self._letter_to_bin.get(letter)
+		if binary is None:
+			binary = _encode_letter(self.encoding, self.digits, letter)
+		return binary
 
 	def _binary_to_letter(self, binary: str) -> str:
 		"""Convert a binary string back to its letter representation."""
-		if self.encoding == 'ABC':
-			pos = int(binary, 2)
-			alfabeto = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-			return alfabeto[pos - 1]
-		elif self.encoding == 'ASCII':
-			return chr(int(binary, 2))
-		else:
-			raise ValueError(f'Codificación desconocida: {self.encoding}')
+		letter = self._bin_to_letter.get(binary)
+		if letter is None:
+			letter = _decode_binary(self.encoding, binary)
+		return letter
 
 	def _rebuild_tree(self):
 		"""Rebuild the tree structure from the current data array."""
 		self.root = None
-		for i, val in enumerate(self.data):
-			if val is not None:
-				letter = self._binary_to_letter(val)
-				self._insert_node(val, i, letter)
+		to_letter = self._binary_to_letter
+		self._insert_batch(
+			[(val, i, to_letter(val)) for i, val in enumerate(self.data) if val is not None]
+		)
+
+	def _insert_batch(self, entries: List[Tuple[str, int, str]]) -> None:
+		"""
+		Insert several nodes into the tree structure.
+
+		Insert each entry in order by default. Subclasses can override
+		this to build the structure in bulk.
+
+		Args:
+			entries: Tuples of (binary, index, letter) to insert.
+
+		"""
+		insert_node = self._insert_node
+		for binary, index, letter in entries:
+			insert_node(binary, index, letter)
 
 	def insert(self, letter: str) -> int:
 		"""
 		Insert a letter into the tree.
 
-		Encode the letter, validate uniqueness, assign storage index,
-		and delegate structural insertion to subclass implementation.
+		Encode the letter, validate uniqueness against the set of stored
+		codes, assign storage index, and delegate structural insertion to
+		subclass implementation. The storage index is the lowest free
+		slot, taken from a min-heap of released positions instead of
+		scanning the data array. The encoded value is always a binary
+		numeral, so only its length is validated here; it is parsed once
+		when the node is built.
+
+		Args:
+			letter: Letter to insert.
 
 		Returns:
 			int: 1-based position where the value was stored.
 
 		Raises:
-			ValueError: If the letter already exists.
+			ValueError: If the letter already exists or its encoding does
+				not have the configured number of digits.
 
 		"""
 		self._validate_structure()
 		letter_norm = self._normalize_letter(letter)
 		binary = self._letter_to_binary(letter_norm)
-		self._validate_value(binary)
+		if len(binary) != self.digits:
+			raise ValueError(f'La clave debe tener exactamente {self.digits} digitos')
 
-		if self.search(letter_norm):
+		if binary in self._present:
 			raise ValueError(f"La letra '{letter_norm}' ya existe en la estructura")
 
-		try:
-			index = self.data.index(None)
-		except ValueError:
+		free = self._free
+		if free:
+			index = free[0]
+		else:
 			self.data.append(None)
 			index = len(self.data) - 1
 			self.size += 1
+			free.append(index)
 
 		self._insert_node(binary, index, letter_norm)
+		heapq.heappop(free)
 		self.data[index] = binary
+		self._present.add(binary)
 		return index + 1
 
+	def insert_many(self, letters: List[str]) -> List[int]:
+		"""
+		Insert several letters into the tree.
+
+		Validate the whole batch before inserting anything, then insert
+		the letters in order. Tree nodes never move their storage slot,
+		so the position returned by each insertion is already final.
+
+		Args:
+			letters: Letters to insert.
+
+		Returns:
+			List[int]: 1-based position of each letter, in input order.
+
+		Raises:
+			ValueError: If a letter is invalid, repeated or already
+				stored. The structure is left unchanged in that case.
+
+		"""
+		self._validate_structure()
+		seen = set(self._present)
+		for letter in letters:
+			letter_norm = self._normalize_letter(letter)
+			binary = self._letter_to_binary(letter_norm)
+			if len(binary) != self.digits:
+				raise ValueError(f'La clave debe tener exactamente {self.digits} digitos')
+			if binary in seen:
+				raise ValueError(f"La letra '{letter_norm}' ya existe en la estructura")
+			seen.add(binary)
+
+		return [self.insert(letter) for letter in letters]
+
+	def build_from(self, letters: List[str]) -> List[int]:
+		"""
+		Replace the tree contents with the given letters.
+
+		Encode and validate every letter before touching the structure,
+		store the codes sorted in the first positions of the data array,
+		and build the tree from them in a single batch. Sorted input
+		fills sibling subtrees from left to right, and the storage stays
+		in the same order that `_rebuild_tree` replays.
+
+		Args:
+			letters: Letters to store.
+
+		Returns:
+			List[int]: 1-based position of each letter, in input order.
+
+		Raises:
+			ValueError: If a letter is invalid or repeated. The structure
+				is left unchanged in that case.
+
+		"""
+		self._validate_structure()
+		codes: List[str] = []
+		letter_of: Dict[str, str] = {}
+		for letter in letters:
+			letter_norm = self._normalize_letter(letter)
+			binary = self._letter_to_binary(letter_norm)
+			if len(binary) != self.digits:
+				raise ValueError(f'La clave debe tener exactamente {self.digits} digitos')
+			if binary in letter_of:
+				raise ValueError(f"La letra '{letter_norm}' ya existe en la estructura")
+			letter_of[binary] = letter_norm
+			codes.append(binary)
+
+		ordered = sorted(letter_of)
+		size = max(self.size, len(ordered))
+		self.size = size
+		self.data = ordered + [None] * (size - len(ordered))
+		self._free = list(range(len(ordered), size))
+		self._present = set(ordered)
+		self.root = None
+		self._insert_batch([(binary, i, letter_of[binary]) for i, binary in enumerate(ordered)])
+
+		position = {binary: i + 1 for i, binary in enumerate(ordered)}
+		return [position[binary] for binary in codes]
+
 	def search(self, letter: str) -> List[int]:
 		"""
 		Search for a letter in the tree.
@@ -284,6 +458,8 @@ class BaseTree(BaseSearchService):
 			return []
 		for pos in positions:
 			self.data[pos - 1] = None
+			heapq.heappush(self._free, pos - 1)
+		self._present.discard(binary)
 		self._delete_node(binary)
 		return positions
 
@@ -295,7 +471,7 @@ class BaseTree(BaseSearchService):
 		"""
 		positions = self.search(letter)
 		if not positions:
-			print(f"La letra '{letter}' no se encontró.")
+			logger.info("La letra '%s' no se encontró.", letter)
 			return
 		target_index = positions[0] - 1
 		self.plot(filename, highlight_index=target_index)
@@ -355,15 +531,51 @@ class BaseTree(BaseSearchService):
 		"""
 		pass
 
+	def _edge_label_points(self, edges, pos) -> List[Tuple[float, float]]:
+		"""
+		Compute where each edge label is drawn.
+
+		Place every label at the midpoint of its edge, shifted by 0.2
+		along the edge normal towards the outside of the tree. All edges
+		are processed at once with NumPy array operations.
+
+		Args:
+			edges: Tuples whose first two items are the edge endpoints.
+			pos: Mapping from node identifier to (x, y) coordinates.
+
+		Returns:
+			List[Tuple[float, float]]: Label coordinates, in edge order.
+
+		"""
+		import numpy as np
+
+		if not edges:
+			return []
+		start = np.array([pos[edge[0]] for edge in edges], dtype=float)
+		end = np.array([pos[edge[1]] for edge in edges], dtype=float)
+		delta = end - start
+		length = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2)
+		safe_length = np.where(length > 0, length, 1.0)
+		normal = np.column_stack((-delta[:, 1], delta[:, 0])) / safe_length[:, None]
+		sign = np.where(end[:, 0] < start[:, 0], -0.2, 0.2)
+		points = (start + end) / 2 + normal * sign[:, None]
+		return [tuple(point) for point in points.tolist()]
+
 	def plot(self, filename: str = 'tree.png', highlight_index: Optional[int] = None):
 		"""
 		Generate a tree visualization image.
 
 		Render nodes and edges using NetworkX and Matplotlib.
 		Highlight a specific node if an index is provided.
+
+		The plotting libraries are imported here rather than at module
+		level, so structures that never plot do not pay their load time.
 		"""
 		if self.root is None:
 			return
+		import matplotlib.pyplot as plt
+		import networkx as nx
+
 		G = nx.DiGraph()
 		self._build_graph(self.root, G, depth=0, highlight_index=highlight_index)
 		self._node_positions = {}
@@ -414,34 +626,20 @@ class BaseTree(BaseSearchService):
 
 		nx.draw_networkx_edges(G, pos, arrows=False, edge_color='gray')
 
-		for u, v, data in G.edges(data=True):
-			if 'label' in data:
-				x1, y1 = pos[u]
-				x2, y2 = pos[v]
-				mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-				dx = x2 - x1
-				dy = y2 - y1
-				length = np.sqrt(dx**2 + dy**2)
-				if length > 0:
-					perp_x = -dy / length
-					perp_y = dx / length
-					if x2 < x1:
-						offset_x = -perp_x * 0.2
-						offset_y = -perp_y * 0.2
-					else:
-						offset_x = perp_x * 0.2
-						offset_y = perp_y * 0.2
-				else:
-					offset_x = offset_y = 0
-				plt.text(
-					mx + offset_x,
-					my + offset_y,
-					data['label'],
-					fontsize=18,
-					ha='center',
-					va='center',
-					bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, pad=1),
-				)
+		labeled_edges = [
+			(u, v, data['label']) for u, v, data in G.edges(data=True) if 'label' in data
+		]
+		label_points = self._edge_label_points(labeled_edges, pos)
+		for (_, _, label), (label_x, label_y) in zip(labeled_edges, label_points):
+			plt.text(
+				label_x,
+				label_y,
+				label,
+				fontsize=18,
+				ha='center',
+				va='center',
+				bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, pad=1),
+			)
 		plt.axis('off')
 		plt.tight_layout()
 		plt.savefig(filename, dpi=150, bbox_inches='tight')
@@ -24,15 +24,14 @@ You should have received a copy of the GNU General Public License
 along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict, List, Optional, Tuple
-
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from app.services.search.base_search import BaseSearchService
 from app.services.search.tree.basic_tree import BaseTree, DigitalNode
 
+if TYPE_CHECKING:
+	import networkx as nx
+
 
 class DigitalTree(BaseTree):
 	"""
@@ -53,16 +52,37 @@ class DigitalTree(BaseTree):
 		"""
 		super().__init__(encoding)
 		self.root: Optional[DigitalNode] = None
+		self._bit_masks: Tuple[int, ...] = ()
 
 	def create(self, size: int = None, digits: int = None) -> None:
 		"""
 		Initialize tree structure and reset root node.
 
 		Delegate storage initialization to the base implementation
-		and clear existing tree state.
+		and clear existing tree state. Precompute the bit masks that
+		select each level's bit for keys of the configured length.
 		"""
 		super().create(size, digits)
 		self.root = None
+		self._bit_masks = self._masks_for(self.digits)
+
+	def _masks_for(self, length: int) -> Tuple[int, ...]:
+		"""
+		Return the per-level bit masks for keys of the given length.
+
+		Reuse the masks computed in `create()` for the configured
+		length and build them on the fly otherwise.
+
+		Args:
+			length: Number of bits in the binary representation.
+
+		Returns:
+			Tuple[int, ...]: Masks from the most to the least significant bit.
+
+		"""
+		if length == len(self._bit_masks):
+			return self._bit_masks
+		return tuple(1 << shift for shift in range(length - 1, -1, -1))
 
 	def _insert_node(self, binary: str, index: int, letter: str) -> None:
 		"""
@@ -80,22 +100,22 @@ class DigitalTree(BaseTree):
 			RuntimeError: If insertion fails unexpectedly.
 
 		"""
-		bits = list(binary)
 		if self.root is None:
 			self.root = DigitalNode(letter, binary, index)
 			return
+		key = int(binary, 2)
 		current = self.root
-		for bit in bits:
-			if bit == '0':
-				if current.left is None:
-					current.left = DigitalNode(letter, binary, index)
-					return
-				current = current.left
-			else:
+		for mask in self._masks_for(len(binary)):
+			if key & mask:
 				if current.right is None:
 					current.right = DigitalNode(letter, binary, index)
 					return
 				current = current.right
+			else:
+				if current.left is None:
+					current.left = DigitalNode(letter, binary, index)
+					return
+				current = current.left
 		raise RuntimeError('Error inesperado: no se pudo insertar')
 
 	def _search_binary(self, binary: str) -> List[int]:
@@ -112,18 +132,18 @@ class DigitalTree(BaseTree):
 			List[int]: 1-based position if found, otherwise empty list.
 
 		"""
-		bits = list(binary)
+		key = int(binary, 2)
 		current = self.root
-		if current and current.binary == binary:
+		if current and current.key == key:
 			return [current.index + 1]
-		for bit in bits:
+		for mask in self._masks_for(len(binary)):
 			if current is None:
 				return []
-			if bit == '0':
-				current = current.left
-			else:
+			if key & mask:
 				current = current.right
-			if current and current.binary == binary:
+			else:
+				current = current.left
+			if current and current.key == key:
 				return [current.index + 1]
 		return []
 
@@ -160,7 +180,7 @@ class DigitalTree(BaseTree):
 	def _build_graph(
 		self,
 		node: Optional[DigitalNode],
-		graph: nx.DiGraph,
+		graph: 'nx.DiGraph',
 		parent_id: Optional[int] = None,
 		edge_label: Optional[str] = None,
 		depth: int = 0,
@@ -169,23 +189,27 @@ class DigitalTree(BaseTree):
 		"""
 		Build a graph representation of the tree.
 
-		Add nodes and labeled edges recursively for visualization.
+		Add nodes and labeled edges in pre-order for visualization,
+		using an explicit stack instead of recursion.
 		Highlight a node if its index matches the specified value.
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		is_highlight = highlight_index is not None and node.index == highlight_index
-		graph.add_node(
-			node_id,
-			label=node.letter if node.letter else '',
-			has_letter=node.letter is not None,
-			is_highlight=is_highlight,
-		)
-		if parent_id is not None:
-			graph.add_edge(parent_id, node_id, label=edge_label)
-		self._build_graph(node.left, graph, node_id, '0', depth + 1, highlight_index)
-		self._build_graph(node.right, graph, node_id, '1', depth + 1, highlight_index)
+		stack = [(node, parent_id, edge_label)]
+		while stack:
+			current, parent, label = stack.pop()
+			if current is None:
+				continue
+			node_id = id(current)
+			is_highlight = highlight_index is not None and current.index == highlight_index
+			graph.add_node(
+				node_id,
+				label=current.letter if current.letter else '',
+				has_letter=current.letter is not None,
+				is_highlight=is_highlight,
+			)
+			if parent is not None:
+				graph.add_edge(parent, node_id, label=label)
+			stack.append((current.right, node_id, '1'))
+			stack.append((current.left, node_id, '0'))
 
 	def _compute_positions(
 		self, node: Optional[DigitalNode], x: float, y: float, level: int, dx: float
@@ -193,16 +217,16 @@ class DigitalTree(BaseTree):
 		"""
 		Compute node coordinates for visualization layout.
 
-		Assign positions recursively, spacing children horizontally
-		according to tree depth.
+		Assign positions with an explicit stack, spacing children
+		horizontally according to tree depth.
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		self._node_positions[node_id] = (x, y)
-		spacing = dx / (2 ** (level + 1))
-		next_y = y - 1.5
-		if node.left:
-			self._compute_positions(node.left, x - spacing, next_y, level + 1, dx)
-		if node.right:
-			self._compute_positions(node.right, x + spacing, next_y, level + 1, dx)
+		stack = [(node, x, y, level)]
+		while stack:
+			current, cur_x, cur_y, cur_level = stack.pop()
+			if current is None:
+				continue
+			self._node_positions[id(current)] = (cur_x, cur_y)
+			spacing = dx / (2 ** (cur_level + 1))
+			next_y = cur_y - 1.5
+			stack.append((current.right, cur_x + spacing, next_y, cur_level + 1))
+			stack.append((current.left, cur_x - spacing, next_y, cur_level + 1))
@@ -27,14 +27,34 @@ import heapq
 from collections import Counter
 from typing import Dict, List, Optional
 
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
-
 from app.services.search.base_search import BaseSearchService
 from app.services.search.tree.basic_tree import BaseTree, SimpleNode
 
 
+class HuffmanNode(SimpleNode):
+	"""
+	Represent a node of the Huffman coding tree.
+
+	Extend the simple binary node with the Huffman code, frequency,
+	display name, and merge level used while building and rendering
+	the tree. Codes have variable length, so they are kept as strings.
+	"""
+
+	__slots__ = ('binary', 'freq', 'name', 'level')
+
+	def __init__(self, letter: Optional[str] = None, index: Optional[int] = None):
+		"""
+		Initialize a Huffman tree node without a code.
+
+		Args:
+			letter: Store the associated character.
+			index: Store the position in the underlying data array.
+
+		"""
+		super().__init__(letter=letter, index=index)
+		self.binary: Optional[str] = None
+
+
 class HuffmanTree(BaseTree):
 	"""
 	Represent a Huffman coding tree constructed from input text.
@@ -65,10 +85,10 @@ class HuffmanTree(BaseTree):
 		total_freq (int):
 			Total number of characters in the input text.
 
-		steps (List[List[SimpleNode]]):
+		steps (List[List[HuffmanNode]]):
 			Intermediate states of the priority queue during tree construction.
 
-		root (Optional[SimpleNode]):
+		root (Optional[HuffmanNode]):
 			Root node of the Huffman tree.
 
 	"""
@@ -98,7 +118,7 @@ class HuffmanTree(BaseTree):
 		self.letter_to_index: Dict[str, int] = {}
 		self.letter_to_code: Dict[str, str] = {}
 		self.total_freq = len(self.text)
-		self.steps: List[List[SimpleNode]] = []
+		self.steps: List[List[HuffmanNode]] = []
 		self._build_tree()
 
 	def _build_tree(self) -> None:
@@ -121,7 +141,7 @@ class HuffmanTree(BaseTree):
 		heap = []
 		next_index = 0
 		for char, count in self.freq_dict.items():
-			leaf = SimpleNode(letter=char, index=next_index)
+			leaf = HuffmanNode(letter=char, index=next_index)
 			leaf.freq = count
 			leaf.name = char
 			leaf.level = 0
@@ -133,7 +153,7 @@ class HuffmanTree(BaseTree):
 		while len(heap) > 1:
 			freq1, _, left = heapq.heappop(heap)
 			freq2, _, right = heapq.heappop(heap)
-			internal = SimpleNode(letter=None, index=next_index)
+			internal = HuffmanNode(letter=None, index=next_index)
 			internal.freq = freq1 + freq2
 			internal.left = left
 			internal.right = right
@@ -163,14 +183,14 @@ class HuffmanTree(BaseTree):
 		nodes.sort(key=lambda n: (-n.freq, n.name))
 		self.steps.append(nodes)
 
-	def _assign_codes(self, node: Optional[SimpleNode], code: str) -> None:
+	def _assign_codes(self, node: Optional[HuffmanNode], code: str) -> None:
 		"""
 		Recursively assign Huffman binary codes to leaf nodes.
 
 		Left edges correspond to '0' and right edges correspond to '1'.
 
 		Args:
-			node (Optional[SimpleNode]):
+			node (Optional[HuffmanNode]):
 				Current node in the traversal.
 
 			code (str):
@@ -218,6 +238,21 @@ class HuffmanTree(BaseTree):
 			'El árbol de Huffman es inmutable; no se pueden eliminar caracteres.'
 		)
 
+	def build_from(self, letters: List[str]) -> List[int]:
+		"""
+		Prevent rebuilding the Huffman tree from new letters.
+
+		Huffman trees are immutable after construction.
+
+		Raises:
+			NotImplementedError:
+				Always raised to indicate the operation is unsupported.
+
+		"""
+		raise NotImplementedError(
+			'El árbol de Huffman es inmutable; no se pueden insertar nuevos caracteres.'
+		)
+
 	def search(self, letter: str) -> List[int]:
 		"""
 		Search for a character in the Huffman tree.
@@ -288,7 +323,7 @@ class HuffmanTree(BaseTree):
 		"""
 		result = []
 
-		def dfs(node: Optional[SimpleNode]) -> None:
+		def dfs(node: Optional[HuffmanNode]) -> None:
 			if node is None:
 				return
 			if node.letter is not None and node.binary == binary:
@@ -381,6 +416,7 @@ class HuffmanTree(BaseTree):
 
 		The tree is rendered using NetworkX and Matplotlib with
 		automatic layout adjustments to prevent label collisions.
+		As in `BaseTree.plot`, both libraries are imported only here.
 
 		Args:
 			filename (str, optional):
@@ -392,6 +428,8 @@ class HuffmanTree(BaseTree):
 		"""
 		if self.root is None:
 			return
+		import matplotlib.pyplot as plt
+		import networkx as nx
 
 		G = nx.DiGraph()
 		self._build_graph(self.root, G, depth=0, highlight_index=highlight_index)
@@ -522,34 +560,20 @@ class HuffmanTree(BaseTree):
 
 		nx.draw_networkx_edges(G, pos, arrows=False, edge_color='gray')
 
-		for u, v, data in G.edges(data=True):
-			if 'label' in data:
-				x1, y1 = pos[u]
-				x2, y2 = pos[v]
-				mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-				dx = x2 - x1
-				dy = y2 - y1
-				length = np.sqrt(dx**2 + dy**2)
-				if length > 0:
-					perp_x = -dy / length
-					perp_y = dx / length
-					if x2 < x1:
-						offset_x = -perp_x * 0.2
-						offset_y = -perp_y * 0.2
-					else:
-						offset_x = perp_x * 0.2
-						offset_y = perp_y * 0.2
-				else:
-					offset_x = offset_y = 0
-				plt.text(
-					mx + offset_x,
-					my + offset_y,
-					data['label'],
-					fontsize=18,
-					ha='center',
-					va='center',
-					bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, pad=1),
-				)
+		labeled_edges = [
+			(u, v, data['label']) for u, v, data in G.edges(data=True) if 'label' in data
+		]
+		label_points = self._edge_label_points(labeled_edges, pos)
+		for (_, _, label), (label_x, label_y) in zip(labeled_edges, label_points):
+			plt.text(
+				label_x,
+				label_y,
+				label,
+				fontsize=18,
+				ha='center',
+				va='center',
+				bbox=dict(facecolor='white', edgecolor='none', alpha=0.7, pad=1),
+			)
 
 		for n, data in G.nodes(data=True):
 			freq = data.get('freq')
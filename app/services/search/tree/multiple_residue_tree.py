@@ -25,15 +25,14 @@ You should have received a copy of the GNU General Public License
 along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict, List, Optional, Tuple
-
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from app.services.search.base_search import BaseSearchService
 from app.services.search.tree.basic_tree import BaseTree, MultiNode
 
+if TYPE_CHECKING:
+	import networkx as nx
+
 
 class MultipleResidueTree(BaseTree):
 	"""
@@ -57,6 +56,9 @@ class MultipleResidueTree(BaseTree):
 		super().__init__(encoding)
 		self.m = m
 		self.root: Optional[MultiNode] = None
+		self._edge_labels: Dict[Tuple[int, int], str] = {}
+		self._widths: Dict[int, int] = {}
+		self._layouts: Dict[int, Tuple[Tuple[int, int], ...]] = {}
 
 	def create(self, size: int = None, digits: int = None) -> None:
 		"""
@@ -68,75 +70,76 @@ class MultipleResidueTree(BaseTree):
 		super().create(size, digits)
 		self.root = None
 
-	def _get_chunks(self, binary: str) -> List[str]:
+	def _chunk_layout(self, length: int) -> Tuple[Tuple[int, int], ...]:
 		"""
-		Split binary string into fixed-size chunks.
+		Describe how to extract each chunk from an integer key.
+
+		The binary string is split into consecutive m-bit chunks from
+		the most significant end; the last one may be shorter. Chunk
+		`depth` of a key with `length` bits is `(key >> shift) & mask`
+		for the pair at that position. Layouts are cached per key
+		length.
 
 		Args:
-			binary: Binary representation of a letter.
+			length: Number of bits in the binary representation.
 
 		Returns:
-			List[str]: List of substrings of length m.
+			Tuple[Tuple[int, int], ...]: One (shift, mask) pair per chunk.
 
 		"""
-		return [binary[i : i + self.m] for i in range(0, len(binary), self.m)]
+		layout = self._layouts.get(length)
+		if layout is None:
+			bounds = [(start, min(start + self.m, length)) for start in range(0, length, self.m)]
+			layout = tuple((length - end, (1 << (end - start)) - 1) for start, end in bounds)
+			self._layouts[length] = layout
+		return layout
 
 	def _insert_node(self, binary: str, index: int, letter: str) -> None:
 		"""
 		Insert a node using chunk-based traversal.
 
-		Partition the binary representation and delegate
-		recursive insertion.
+		Partition the binary representation and descend one chunk per
+		level, creating internal nodes when necessary and resolving
+		collisions by redistributing existing leaves.
 
 		Args:
 			binary: Binary representation of the letter.
 			index: Position in underlying storage.
 			letter: Original letter value.
 
-		"""
-		chunks = self._get_chunks(binary)
-		if self.root is None:
-			self.root = MultiNode(self.m)
-		self._insert_rec(self.root, chunks, 0, letter, binary, index)
-
-	def _insert_rec(
-		self, node: MultiNode, chunks: List[str], depth: int, letter: str, binary: str, index: int
-	):
-		"""
-		Recursively insert a node based on chunk index.
-
-		Create internal nodes when necessary and resolve
-		collisions by redistributing existing leaves.
-
 		Raises:
 			ValueError: If depth exceeds chunk length
 				or a duplicate key is detected.
 
 		"""
-		if depth == len(chunks):
-			raise ValueError('Profundidad excedida')
-		chk = chunks[depth]
-		idx = int(chk, 2)
-
-		if depth == len(chunks) - 1:
-			if node.children[idx] is not None:
-				raise ValueError('Clave duplicada')
-			node.children[idx] = MultiNode(self.m, letter, binary, index)
-			return
-
-		if node.children[idx] is None:
-			node.children[idx] = MultiNode(self.m)
-			self._insert_rec(node.children[idx], chunks, depth + 1, letter, binary, index)
-		elif node.children[idx].letter is not None:
-			existing_leaf = node.children[idx]
-			new_internal = MultiNode(self.m)
-			node.children[idx] = new_internal
-			existing_chunks = self._get_chunks(existing_leaf.binary)
-			next_idx = int(existing_chunks[depth + 1], 2)
-			new_internal.children[next_idx] = existing_leaf
-			self._insert_rec(new_internal, chunks, depth + 1, letter, binary, index)
-		else:
-			self._insert_rec(node.children[idx], chunks, depth + 1, letter, binary, index)
+		layout = self._chunk_layout(len(binary))
+		key = int(binary, 2)
+		if self.root is None:
+			self.root = MultiNode(self.m)
+
+		node = self.root
+		last_depth = len(layout) - 1
+		for depth, (shift, mask) in enumerate(layout):
+			idx = (key >> shift) & mask
+
+			if depth == last_depth:
+				if idx in node.children:
+					raise ValueError('Clave duplicada')
+				node.children[idx] = MultiNode(self.m, letter, binary, index)
+				return
+
+			child = node.children.get(idx)
+			if child is None:
+				child = node.children[idx] = MultiNode(self.m)
+			elif child.letter is not None:
+				existing_leaf = child
+				child = node.children[idx] = MultiNode(self.m)
+				next_shift, next_mask = layout[depth + 1]
+				next_idx = (existing_leaf.key >> next_shift) & next_mask
+				child.children[next_idx] = existing_leaf
+			node = child
+
+		raise ValueError('Profundidad excedida')
 
 	def _search_binary(self, binary: str) -> List[int]:
 		"""
@@ -151,14 +154,17 @@ class MultipleResidueTree(BaseTree):
 			List[int]: 1-based position if found, otherwise empty list.
 
 		"""
-		chunks = self._get_chunks(binary)
+		key = int(binary, 2)
 		current = self.root
-		for chk in chunks:
+		for shift, mask in self._chunk_layout(len(binary)):
 			if current is None:
 				return []
-			idx = int(chk, 2)
-			current = current.children[idx]
-		if current and current.binary == binary:
+			current = current.children.get((key >> shift) & mask)
+		if current is None:
+			return []
+		# Every stored key has `digits` bits and leaves only live at the
+		# last chunk, so a full-length path already identifies the key.
+		if len(binary) == self.digits or current.key == key:
 			return [current.index + 1]
 		return []
 
@@ -181,32 +187,41 @@ class MultipleResidueTree(BaseTree):
 		"""
 		Remove a node matching the given binary value.
 
-		Traverse recursively and prune empty internal nodes
-		after deletion.
+		Descend chunk by chunk recording the visited nodes, then prune
+		empty internal nodes on the way back up.
 
 		Args:
 			binary: Binary representation of the node to remove.
 
 		"""
-		chunks = self._get_chunks(binary)
-
-		def remove(node: Optional[MultiNode], depth: int) -> Optional[MultiNode]:
-			if node is None:
-				return None
-			if depth == len(chunks):
-				return None
-			idx = int(chunks[depth], 2)
-			node.children[idx] = remove(node.children[idx], depth + 1)
-			if node.letter is None and all(c is None for c in node.children):
-				return None
-			return node
+		layout = self._chunk_layout(len(binary))
+		key = int(binary, 2)
+
+		path: List[Tuple[MultiNode, int]] = []
+		node = self.root
+		while node is not None and len(path) < len(layout):
+			shift, mask = layout[len(path)]
+			idx = (key >> shift) & mask
+			path.append((node, idx))
+			node = node.children.get(idx)
+
+		result: Optional[MultiNode] = None
+		for parent, idx in reversed(path):
+			if result is None:
+				parent.children.pop(idx, None)
+			else:
+				parent.children[idx] = result
+			if parent.letter is None and not parent.children:
+				result = None
+			else:
+				result = parent
 
-		self.root = remove(self.root, 0)
+		self.root = result
 
 	def _build_graph(
 		self,
 		node: Optional[MultiNode],
-		graph: nx.DiGraph,
+		graph: 'nx.DiGraph',
 		parent_id: Optional[int] = None,
 		edge_label: Optional[str] = None,
 		depth: int = 0,
@@ -215,56 +230,84 @@ class MultipleResidueTree(BaseTree):
 		"""
 		Build a graph representation of the tree.
 
-		Add nodes and labeled edges recursively.
+		Add nodes and labeled edges in pre-order, using an explicit
+		stack instead of recursion.
 		Label edges using the corresponding m-bit chunk.
 		Highlight a node if its index matches the specified value.
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		is_highlight = highlight_index is not None and node.index == highlight_index
-		graph.add_node(
-			node_id,
-			label=node.letter if node.letter else '',
-			has_letter=node.letter is not None,
-			is_highlight=is_highlight,
-		)
-		if parent_id is not None:
-			graph.add_edge(parent_id, node_id, label=edge_label)
-		for i, child in enumerate(node.children):
-			if child is not None:
+		stack = [(node, parent_id, edge_label, depth)]
+		while stack:
+			current, parent, label, level = stack.pop()
+			if current is None:
+				continue
+			node_id = id(current)
+			is_highlight = highlight_index is not None and current.index == highlight_index
+			graph.add_node(
+				node_id,
+				label=current.letter if current.letter else '',
+				has_letter=current.letter is not None,
+				is_highlight=is_highlight,
+			)
+			if parent is not None:
+				graph.add_edge(parent, node_id, label=label)
+			for i, child in sorted(current.children.items(), reverse=True):
+				width = self.m
 				if child.letter is not None:
-					chunks = self._get_chunks(child.binary)
-					if depth < len(chunks):
-						edge = chunks[depth]
-					else:
-						edge = format(i, 'b').zfill(self.m)
-				else:
-					edge = format(i, 'b').zfill(self.m)
-				self._build_graph(child, graph, node_id, edge, depth + 1, highlight_index)
+					layout = self._chunk_layout(self.digits)
+					if level < len(layout):
+						width = layout[level][1].bit_length()
+				stack.append((child, node_id, self._edge_label(i, width), level + 1))
+
+
+	def _edge_label(self, idx: int, width: int) -> str:
+		"""
+		Return the bit string drawn on an edge.
+
+		Labels are formatted on first use and cached, since only a
+		handful of distinct chunk values appear in a tree.
 
+		Args:
+			idx: Chunk value of the child slot.
+			width: Number of bits in the chunk.
+
+		Returns:
+			str: The chunk value as a zero-padded binary string.
+
+		"""
+		label = self._edge_labels.get((idx, width))
+		if label is None:
+			label = self._edge_labels[(idx, width)] = format(idx, f'0{width}b')
+		return label
 
-	def _calculate_width(self, node: Optional[MultiNode]) -> int:
+	def _subtree_widths(self, node: Optional[MultiNode]) -> Dict[int, int]:
 		"""
-		Calculate the width of a subtree for visualization.
+		Calculate the width of every subtree for visualization.
 
-		Count the number of leaf nodes (nodes with letters) in the subtree.
+		Count the leaf nodes (nodes with letters) below each node in a
+		single post-order pass, so the layout never recounts a subtree.
 
 		Args:
-			node: The root of the subtree.
+			node: The root of the tree.
 
 		Returns:
-			The total width (number of leaf nodes) in the subtree.
+			Dict[int, int]: Width of each subtree, keyed by `id(node)`.
 
 		"""
-		if node is None:
-			return 0
-		if node.letter is not None:
-			return 1
-		total = 0
-		for child in node.children:
-			total += self._calculate_width(child)
-		return total
+		order: List[MultiNode] = []
+		stack = [node] if node is not None else []
+		while stack:
+			current = stack.pop()
+			order.append(current)
+			if current.letter is None:
+				stack.extend(current.children.values())
+
+		widths: Dict[int, int] = {}
+		for current in reversed(order):
+			if current.letter is not None:
+				widths[id(current)] = 1
+			else:
+				widths[id(current)] = sum(widths[id(c)] for c in current.children.values())
+		return widths
 
 
 	def _compute_positions_interval(
@@ -274,8 +317,8 @@ class MultipleResidueTree(BaseTree):
 		Compute node positions for visualization layout.
 
 		Assign x-coordinates based on the width of subtrees to ensure
-		proper spacing. Recursively compute positions for child nodes
-		within their allocated horizontal intervals.
+		proper spacing. Child nodes are positioned within their allocated
+		horizontal intervals using an explicit stack.
 
 		Args:
 			node: The current node being positioned.
@@ -284,38 +327,41 @@ class MultipleResidueTree(BaseTree):
 			y: The vertical coordinate for this node.
 
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		x = (left + right) / 2
-		self._node_positions[node_id] = (x, y)
-		children_with_idx = [(i, child) for i, child in enumerate(node.children) if child is not None]
-		if not children_with_idx:
-			return
-		child_widths = [self._calculate_width(child) for _, child in children_with_idx]
-		total_width = sum(child_widths)
-		if total_width == 0:
-			return
-		next_y = y - 1.5
-		current_left = left
-		for (i, child), width in zip(children_with_idx, child_widths):
-			proportion = width / total_width
-			child_right = current_left + (right - left) * proportion
-			if len(children_with_idx) == 1:
-				shift = (right - left) * 0.15
-				msb = (i >> (self.m - 1)) & 1
-				child_center = (current_left + child_right) / 2
-				if msb == 1:
-					new_center = child_center + shift
+		stack = [(node, left, right, y)]
+		while stack:
+			current, cur_left, cur_right, cur_y = stack.pop()
+			if current is None:
+				continue
+			self._node_positions[id(current)] = ((cur_left + cur_right) / 2, cur_y)
+			children_with_idx = sorted(current.children.items())
+			if not children_with_idx:
+				continue
+			child_widths = [self._widths[id(child)] for _, child in children_with_idx]
+			total_width = sum(child_widths)
+			if total_width == 0:
+				continue
+			next_y = cur_y - 1.5
+			current_left = cur_left
+			pending = []
+			for (i, child), width in zip(children_with_idx, child_widths):
+				proportion = width / total_width
+				child_right = current_left + (cur_right - cur_left) * proportion
+				if len(children_with_idx) == 1:
+					shift = (cur_right - cur_left) * 0.15
+					msb = (i >> (self.m - 1)) & 1
+					child_center = (current_left + child_right) / 2
+					if msb == 1:
+						new_center = child_center + shift
+					else:
+						new_center = child_center - shift
+					half_width = (child_right - current_left) / 2
+					pending.append(
+						(child, new_center - half_width, new_center + half_width, next_y)
+					)
 				else:
-					new_center = child_center - shift
-				half_width = (child_right - current_left) / 2
-				new_left = new_center - half_width
-				new_right = new_center + half_width
-				self._compute_positions_interval(child, new_left, new_right, next_y)
-			else:
-				self._compute_positions_interval(child, current_left, child_right, next_y)
-			current_left = child_right
+					pending.append((child, current_left, child_right, next_y))
+				current_left = child_right
+			stack.extend(reversed(pending))
 
 
 	def _compute_positions(
@@ -337,4 +383,5 @@ class MultipleResidueTree(BaseTree):
 			dx: The horizontal spacing factor for positioning child nodes.
 
 		"""
+		self._widths = self._subtree_widths(node)
 		self._compute_positions_interval(node, x - dx / 2, x + dx / 2, y)
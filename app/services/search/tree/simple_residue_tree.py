@@ -23,15 +23,14 @@ You should have received a copy of the GNU General Public License
 along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import List, Optional
-
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
+from typing import TYPE_CHECKING, List, Optional
 
 from app.services.search.base_search import BaseSearchService
 from app.services.search.tree.basic_tree import BaseTree, SimpleNode
 
+if TYPE_CHECKING:
+	import networkx as nx
+
 
 class SimpleResidueTree(BaseTree):
 	"""
@@ -80,57 +79,55 @@ class SimpleResidueTree(BaseTree):
 			ValueError: If traversal depth exceeds binary length.
 
 		"""
-		bits = list(binary)
+		key = int(binary, 2)
+		top = len(binary) - 1
 
 		if self.root is None:
 			self.root = SimpleNode()
-			if bits[0] == '0':
-				self.root.left = SimpleNode(letter, binary, index)
-			else:
+			if (key >> top) & 1:
 				self.root.right = SimpleNode(letter, binary, index)
+			else:
+				self.root.left = SimpleNode(letter, binary, index)
 			return
 
 		if self.root.letter is not None:
 			old_root = self.root
 			self.root = SimpleNode()
-			if old_root.binary[0] == '0':
-				self.root.left = old_root
-			else:
+			if (old_root.key >> top) & 1:
 				self.root.right = old_root
-
-		def insert_rec(node: SimpleNode, depth: int) -> None:
-			bit = bits[depth]
-			if bit == '0':
-				child = node.left
 			else:
-				child = node.right
+				self.root.left = old_root
+
+		node = self.root
+		shift = top
+		while True:
+			bit = (key >> shift) & 1
+			child = node.right if bit else node.left
 
 			if child is None:
 				new_leaf = SimpleNode(letter, binary, index)
-				if bit == '0':
-					node.left = new_leaf
-				else:
+				if bit:
 					node.right = new_leaf
+				else:
+					node.left = new_leaf
 				return
-			else:
-				if child.letter is not None:
-					if depth == len(bits) - 1:
-						raise ValueError('Inconsistencia: colisión en el último nivel')
-					new_internal = SimpleNode()
-					next_bit = child.binary[depth + 1]
-					if next_bit == '0':
-						new_internal.left = child
-					else:
-						new_internal.right = child
-					if bit == '0':
-						node.left = new_internal
-					else:
-						node.right = new_internal
-					insert_rec(new_internal, depth + 1)
+
+			if child.letter is not None:
+				if shift == 0:
+					raise ValueError('Inconsistencia: colisión en el último nivel')
+				new_internal = SimpleNode()
+				if (child.key >> (shift - 1)) & 1:
+					new_internal.right = child
 				else:
-					insert_rec(child, depth + 1)
+					new_internal.left = child
+				if bit:
+					node.right = new_internal
+				else:
+					node.left = new_internal
+				child = new_internal
 
-		insert_rec(self.root, 0)
+			node = child
+			shift -= 1
 
 	def _search_binary(self, binary: str) -> List[int]:
 		"""
@@ -146,21 +143,21 @@ class SimpleResidueTree(BaseTree):
 			List[int]: 1-based position if found, otherwise empty list.
 
 		"""
-		bits = list(binary)
+		key = int(binary, 2)
 		current = self.root
-		for bit in bits:
+		for shift in range(len(binary) - 1, -1, -1):
 			if current is None:
 				return []
 			if current.letter is not None:
-				if current.binary == binary:
+				if current.key == key:
 					return [current.index + 1]
 				else:
 					return []
-			if bit == '0':
-				current = current.left
-			else:
+			if (key >> shift) & 1:
 				current = current.right
-		if current and current.letter is not None and current.binary == binary:
+			else:
+				current = current.left
+		if current and current.letter is not None and current.key == key:
 			return [current.index + 1]
 		return []
 
@@ -168,48 +165,73 @@ class SimpleResidueTree(BaseTree):
 		"""
 		Remove a node matching the given binary value.
 
-		Prune empty internal nodes recursively after deletion.
+		Descend along the binary digits recording the visited internal
+		nodes, then prune empty internal nodes on the way back up.
 
 		Args:
 			binary: Binary representation of the node to remove.
 
 		"""
-		bits = list(binary)
+		key = int(binary, 2)
+		top = len(binary) - 1
+		path: List[SimpleNode] = []
+		node = self.root
+		while node is not None and node.letter is None and len(path) <= top:
+			node_bit = (key >> (top - len(path))) & 1
+			path.append(node)
+			node = node.right if node_bit else node.left
 
-		def remove(node: Optional[SimpleNode], depth: int) -> Optional[SimpleNode]:
-			if node is None:
-				return None
+		if node is None:
+			result = None
+		elif node.letter is not None:
+			result = None if node.key == key else node
+		else:
+			result = self._prune(node, len(path))
+
+		for depth in range(len(path) - 1, -1, -1):
+			parent = path[depth]
+			if (key >> (top - depth)) & 1:
+				parent.right = result
+			else:
+				parent.left = result
+			result = self._prune(parent, depth)
 
-			if node.letter is not None:
-				if node.binary == binary:
-					return None
-				else:
-					return node
+		self.root = result
 
-			if depth < len(bits):
-				bit = bits[depth]
-				if bit == '0':
-					node.left = remove(node.left, depth + 1)
-				else:
-					node.right = remove(node.right, depth + 1)
+	def _prune(self, node: SimpleNode, depth: int) -> Optional[SimpleNode]:
+		"""
+		Return what should replace an internal node after a deletion.
 
-			if node.left is None and node.right is None:
-				return None
+		Drop the node when it has no children and, below the root level,
+		replace it by its only child when that child is a leaf. A lone
+		internal child is kept in place, since hoisting it would make
+		later lookups read its bits at the wrong depth.
 
-			if depth != 0:
-				if node.left is not None and node.right is None:
-					return node.left
-				if node.right is not None and node.left is None:
-					return node.right
+		Args:
+			node: Internal node whose subtree was updated.
+			depth: Level of the node in the tree.
 
-			return node
+		Returns:
+			Optional[SimpleNode]: Replacement node, or None to remove it.
 
-		self.root = remove(self.root, 0)
+		"""
+		if node.left is None and node.right is None:
+			return None
+		if depth != 0:
+			if node.right is None:
+				child = node.left
+			elif node.left is None:
+				child = node.right
+			else:
+				return node
+			if child.letter is not None:
+				return child
+		return node
 
 	def _build_graph(
 		self,
 		node: Optional[SimpleNode],
-		graph: nx.DiGraph,
+		graph: 'nx.DiGraph',
 		parent_id: Optional[int] = None,
 		edge_label: Optional[str] = None,
 		depth: int = 0,
@@ -218,23 +240,27 @@ class SimpleResidueTree(BaseTree):
 		"""
 		Build a graph representation of the tree.
 
-		Add nodes and labeled edges recursively for visualization.
+		Add nodes and labeled edges in pre-order for visualization,
+		using an explicit stack instead of recursion.
 		Highlight a node if its index matches the specified value.
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		is_highlight = highlight_index is not None and node.index == highlight_index
-		graph.add_node(
-			node_id,
-			label=node.letter if node.letter else '',
-			has_letter=node.letter is not None,
-			is_highlight=is_highlight,
-		)
-		if parent_id is not None:
-			graph.add_edge(parent_id, node_id, label=edge_label)
-		self._build_graph(node.left, graph, node_id, '0', depth + 1, highlight_index)
-		self._build_graph(node.right, graph, node_id, '1', depth + 1, highlight_index)
+		stack = [(node, parent_id, edge_label)]
+		while stack:
+			current, parent, label = stack.pop()
+			if current is None:
+				continue
+			node_id = id(current)
+			is_highlight = highlight_index is not None and current.index == highlight_index
+			graph.add_node(
+				node_id,
+				label=current.letter if current.letter else '',
+				has_letter=current.letter is not None,
+				is_highlight=is_highlight,
+			)
+			if parent is not None:
+				graph.add_edge(parent, node_id, label=label)
+			stack.append((current.right, node_id, '1'))
+			stack.append((current.left, node_id, '0'))
 
 	def _compute_positions(
 		self, node: Optional[SimpleNode], x: float, y: float, level: int, dx: float
@@ -242,16 +268,16 @@ class SimpleResidueTree(BaseTree):
 		"""
 		Compute node coordinates for visualization layout.
 
-		Assign positions recursively, spacing children horizontally
-		according to tree depth.
+		Assign positions with an explicit stack, spacing children
+		horizontally according to tree depth.
 		"""
-		if node is None:
-			return
-		node_id = id(node)
-		self._node_positions[node_id] = (x, y)
-		spacing = dx / (2 ** (level + 1))
-		next_y = y - 1.5
-		if node.left:
-			self._compute_positions(node.left, x - spacing, next_y, level + 1, dx)
-		if node.right:
-			self._compute_positions(node.right, x + spacing, next_y, level + 1, dx)
+		stack = [(node, x, y, level)]
+		while stack:
+			current, cur_x, cur_y, cur_level = stack.pop()
+			if current is None:
+				continue
+			self._node_positions[id(current)] = (cur_x, cur_y)
+			spacing = dx / (2 ** (cur_level + 1))
+			next_y = cur_y - 1.5
+			stack.append((current.right, cur_x + spacing, next_y, cur_level + 1))
+			stack.append((current.left, cur_x - spacing, next_y, cur_level + 1))
@@ -24,53 +24,92 @@ along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
 """
 
 import threading
-import time
 
-import requests
 import uvicorn
 import webview
 
-from main import app
 
+def load_app():
+	"""Import and return the FastAPI application.
 
-def start_api():
-	"""Run the FastAPI server in a background thread.
+	Uvicorn calls this factory from the server thread, so the application
+	is built there while the main thread goes on to set up the window.
+
+	Returns:
+	    FastAPI: The application defined in `main`.
 
-	The server is started using Uvicorn on host 127.0.0.1 and port 8000.
 	"""
-	uvicorn.run(app, host='127.0.0.1', port=8000, reload=False)
+	from main import app
+
+	return app
+
 
+class ApiServer(uvicorn.Server):
+	"""Uvicorn server that reports when it starts accepting connections.
+
+	Attributes:
+	    ready (threading.Event): Set once the listening socket is bound.
+
+	"""
 
-def wait_for_server(url: str, timeout: int = 10) -> bool:
-	"""Wait until the FastAPI server becomes available.
+	def __init__(self, config: uvicorn.Config, ready: threading.Event):
+		"""Initialize the server.
 
-	It repeatedly sends HTTP requests to the specified URL until
-	the server responds with a 200 status code or the timeout is reached.
+		Args:
+		    config (uvicorn.Config): Uvicorn configuration.
+		    ready (threading.Event): Event to set once the server is up.
+
+		"""
+		super().__init__(config)
+		self.ready = ready
+
+	async def startup(self, sockets=None) -> None:
+		"""Start the server and signal readiness if it succeeded."""
+		await super().startup(sockets=sockets)
+		if self.started:
+			self.ready.set()
+
+
+def create_server(ready: threading.Event) -> ApiServer:
+	"""Build the server for the FastAPI application.
+
+	The server listens on host 127.0.0.1 and port 8000 with the httptools
+	parser. Uvicorn picks uvloop on its own wherever it is installed.
+	Access logging is off and only warnings are logged, since the
+	packaged launcher runs without a console.
 
 	Args:
-	    url (str): The server URL to check.
-	    timeout (int, optional): Maximum waiting time in seconds.
-	        Defaults to 10.
+	    ready (threading.Event): Event to set once the server is up.
 
 	Returns:
-	    bool: True if the server is available, False otherwise.
+	    ApiServer: The configured server, not yet running.
 
 	"""
-	for _ in range(timeout * 10):
-		try:
-			r = requests.get(url, timeout=2)
-			if r.status_code == 200:
-				return True
-		except requests.exceptions.ConnectionError:
-			time.sleep(0.1)
-	return False
+	config = uvicorn.Config(
+		load_app,
+		factory=True,
+		host='127.0.0.1',
+		port=8000,
+		reload=False,
+		http='httptools',
+		access_log=False,
+		log_level='warning',
+	)
+	return ApiServer(config, ready)
 
 
 if __name__ == '__main__':
-	threading.Thread(target=start_api, daemon=True).start()
-
-	if wait_for_server('http://127.0.0.1:8000'):
+	ready = threading.Event()
+	server = create_server(ready)
+	api_thread = threading.Thread(target=server.run, daemon=True)
+	api_thread.start()
+
+	# pywebview needs the main thread, so Uvicorn runs in the background and
+	# is asked to shut down gracefully once the window is closed.
+	if ready.wait(10):
 		webview.create_window('Ciencias de la Computacion II', 'http://127.0.0.1:8000')
 		webview.start()
+		server.should_exit = True
+		api_thread.join(timeout=5)
 	else:
 		print('Error: FastAPI server did not start in time.')
@@ -1,8 +1,8 @@
 """Iinitialize and configures the FastAPI application.
 
 It mounts a static files directory to serve HTML, CSS, and JavaScript
-resources and defines the root endpoint that returns the main
-`index.html` file of the project.
+resources and serves the main `index.html` file of the project from
+the root path.
 
 Author: Juan Esteban Bedoya <jebedoyal@udistrital.edu.co>
 
@@ -27,8 +27,9 @@ import sys
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
 
 from app.controllers import (
 	binary_external_router,
@@ -42,6 +43,34 @@ from app.controllers import (
 	tree_router,
 )
 
+
+class CachedStaticFiles(StaticFiles):
+	"""Serve static files with long-lived caching for assets.
+
+	Scripts, stylesheets and images are marked immutable so the webview
+	reuses them without revalidating. HTML pages keep the ETag and
+	Last-Modified validation done by `StaticFiles`.
+	"""
+
+	ASSET_SUFFIXES = ('.js', '.css', '.png', '.ico')
+
+	async def get_response(self, path: str, scope: Scope) -> Response:
+		"""Return the file response, adding cache headers to assets.
+
+		Args:
+		    path (str): Requested path relative to the static directory.
+		    scope (Scope): ASGI connection scope.
+
+		Returns:
+		    Response: The response produced by `StaticFiles`.
+
+		"""
+		response = await super().get_response(path, scope)
+		if response.status_code in (200, 304) and path.endswith(self.ASSET_SUFFIXES):
+			response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+		return response
+
+
 app = FastAPI(
 	title='ComputerScience2',
 	description='Simulator of different data structures.',
@@ -51,8 +80,8 @@ app.add_middleware(
 	CORSMiddleware,
 	allow_origins=['http://localhost:8000', 'http://127.0.0.1:8000'],
 	allow_credentials=True,
-	allow_methods=['*'],
-	allow_headers=['*'],
+	allow_methods=['GET', 'POST', 'DELETE'],
+	allow_headers=['Content-Type'],
 )
 app.include_router(linear_search_router)
 app.include_router(binary_search_router)
@@ -64,24 +93,16 @@ app.include_router(binary_external_router)
 app.include_router(hash_external_router)
 app.include_router(dynamic_hash_router)
 
+# Bundled assets cannot change for the life of a frozen build, so only
+# there are they cached; from source they stay editable.
 if getattr(sys, 'frozen', False):
-	BASE_PATH = getattr(sys, '_MEIPASS', os.path.abspath('.'))
+	BASE_PATH = sys._MEIPASS
+	static_files = CachedStaticFiles
 else:
-	BASE_PATH = os.path.abspath('.')
+	BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+	static_files = StaticFiles
 static_path = os.path.join(BASE_PATH, 'static')
 
-app.mount('/static', StaticFiles(directory=static_path), name='static')
-
-
-@app.get('/')
-def read_root() -> FileResponse:
-	"""Return the main index.html file.
-
-	This endpoint serves the initial HTML page of the application,
-	located inside the `static` directory.
-
-	Returns:
-	    FileResponse: The `index.html` file from the static folder.
-
-	"""
-	return FileResponse(os.path.join(static_path, 'index.html'))
+app.mount('/static', static_files(directory=static_path), name='static')
+# Serve index.html for `/`; mounted last so it does not shadow the API routes.
+app.mount('/', static_files(directory=static_path, html=True), name='root')
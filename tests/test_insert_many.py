@@ -0,0 +1,49 @@
+"""
+Test batch insertion into the sorted search services.
+
+This file is part of ComputerScience2 project.
+
+ComputerScience2 is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+ComputerScience2 is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from app.services.search.binary_search import BinarySearchService
+from app.services.search.linear_search import LinearSearchService
+
+
+class TestInsertMany(unittest.TestCase):
+	"""Check that batch inserts report final positions."""
+
+	def test_out_of_order_batch_reports_final_positions(self):
+		"""Positions match the sorted data, not the moment of insertion."""
+		for service_class in (BinarySearchService, LinearSearchService):
+			with self.subTest(service=service_class.__name__):
+				service = service_class()
+				service.create(4, 1)
+				self.assertEqual(service.insert_many(['5', '1', '3']), [3, 1, 2])
+				self.assertEqual(service.data, ['1', '3', '5', None])
+
+	def test_rejected_batch_leaves_structure_unchanged(self):
+		"""A key already stored rejects the whole batch."""
+		service = BinarySearchService()
+		service.create(4, 1)
+		service.insert('1')
+		with self.assertRaises(ValueError):
+			service.insert_many(['7', '1'])
+		self.assertEqual(service.data, ['1', None, None, None])
+
+
+if __name__ == '__main__':
+	unittest.main()
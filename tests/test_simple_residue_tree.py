@@ -0,0 +1,51 @@
+"""
+Test deletion and re-insertion in the simple residue tree.
+
+This file is part of ComputerScience2 project.
+
+ComputerScience2 is free software: you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+ComputerScience2 is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with ComputerScience2. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+
+from app.services.search.tree.simple_residue_tree import SimpleResidueTree
+
+
+class TestSimpleResidueTreeDelete(unittest.TestCase):
+	"""Check that deletions keep the remaining letters reachable."""
+
+	def setUp(self):
+		"""Create an ABC tree holding A, B and C."""
+		self.tree = SimpleResidueTree('ABC')
+		self.tree.create()
+		for letter in 'ABC':
+			self.tree.insert(letter)
+
+	def test_sibling_stays_reachable_after_delete(self):
+		"""Deleting A must not hide C behind a hoisted internal node."""
+		self.assertEqual(self.tree.delete('A'), [1])
+		self.assertEqual(self.tree.search('B'), [2])
+		self.assertEqual(self.tree.search('C'), [3])
+
+	def test_letter_can_be_deleted_and_reinserted(self):
+		"""C can be removed and inserted again after A is deleted."""
+		self.tree.delete('A')
+		self.assertEqual(self.tree.delete('C'), [3])
+		self.assertEqual(self.tree.search('C'), [])
+		position = self.tree.insert('C')
+		self.assertEqual(self.tree.search('C'), [position])
+
+
+if __name__ == '__main__':
+	unittest.main()